@@ -1,11 +1,27 @@
 import os
+import re
+import json
+import hashlib
+import atexit
 import sqlite3
 import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from queue import Empty, Full, LifoQueue
 from datetime import datetime, time, timedelta
+from types import SimpleNamespace
 
-from flask import Flask, render_template, request, redirect, url_for, jsonify
+import orjson
+from aiohttp import ClientSession, TCPConnector
+from flask import Flask, Response, render_template, request, redirect, url_for, jsonify
+from flask.json.provider import JSONProvider
 from dotenv import load_dotenv
+from jinja2 import FileSystemBytecodeCache
 from neispy import Neispy
+from neispy.error import DataNotFound
+from time import monotonic
 from zoneinfo import ZoneInfo
 
 # -------------------------------------------------------------
@@ -13,7 +29,21 @@ from zoneinfo import ZoneInfo
 # -------------------------------------------------------------
 load_dotenv()
 
+
+class ORJSONProvider(JSONProvider):
+    """jsonify 직렬화를 orjson(C 구현)으로 처리"""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
+# 컴파일된 템플릿을 임시 폴더에 저장해 재시작 때 다시 컴파일하지 않음
+app.jinja_env.bytecode_cache = FileSystemBytecodeCache()
 
 NEIS_API_KEY = os.getenv("NEIS_API_KEY")
 SCHOOL_NAME  = os.getenv("SCHOOL_NAME")
@@ -33,126 +63,460 @@ def now_kst():
 # -------------------------------------------------------------
 # SQLite 초기화 (수행평가)
 # -------------------------------------------------------------
-def init_db():
-    conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
-    c.execute("""
-        CREATE TABLE IF NOT EXISTS assessments (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            subject    TEXT NOT NULL,
-            title      TEXT NOT NULL,
-            due_date   TEXT,
-            detail     TEXT,
-            created_at TEXT
+SQLITE_PRAGMAS = """
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA busy_timeout=5000;
+    PRAGMA cache_size=-20000;
+    PRAGMA temp_store=MEMORY;
+"""
+
+# SQL 문은 상수로 두고 항상 같은 문자열을 넘겨 연결별 statement 캐시를 재사용
+SQL_INSERT_ASSESSMENT = """
+    INSERT INTO assessments (subject, title, due_date, detail, created_at)
+    VALUES (?, ?, ?, ?, ?)
+"""
+SQL_SELECT_ASSESSMENTS = """
+    SELECT id, subject, title, due_date, detail, created_at
+    FROM assessments
+    ORDER BY due_date
+"""
+SQL_LAST_ASSESSMENT = """
+    SELECT id, created_at FROM assessments ORDER BY id DESC LIMIT 1
+"""
+SQL_CACHE_GET = """
+    SELECT value, fetched_at FROM neis_cache WHERE endpoint = ? AND key = ?
+"""
+SQL_CACHE_PUT = """
+    INSERT OR REPLACE INTO neis_cache (endpoint, key, value, fetched_at)
+    VALUES (?, ?, ?, ?)
+"""
+
+
+def connect(readonly=False):
+    """WAL + synchronous=NORMAL 등 권장 PRAGMA를 적용한 연결
+
+    쓰기 연결은 BEGIN IMMEDIATE로 트랜잭션을 열고, 읽기 연결은 mode=ro로 연다.
+    """
+    if readonly:
+        conn = sqlite3.connect(
+            f"file:{DB_PATH}?mode=ro",
+            uri=True,
+            isolation_level=None,
+            check_same_thread=False,
         )
-    """)
-    conn.commit()
-    conn.close()
+    else:
+        conn = sqlite3.connect(
+            f"file:{DB_PATH}",
+            uri=True,
+            isolation_level="IMMEDIATE",
+            check_same_thread=False,
+        )
+    conn.executescript(SQLITE_PRAGMAS)
+    conn.row_factory = sqlite3.Row  # 튜플처럼 풀어 쓸 수도, dict(row)로 바꿀 수도 있음
+    return conn
+
+
+# 쓰기는 연결 하나를 락으로 직렬화하고, 읽기는 읽기 전용 연결 풀에서 가져온다.
+# WAL 모드라 쓰기 중에도 읽기가 막히지 않는다.
+# (개발 서버는 요청마다 새 스레드를 쓰므로 thread-local 대신 큐)
+_WRITE_LOCK = threading.Lock()
+_WRITE_CONN = None
+_READ_POOL = LifoQueue(maxsize=os.cpu_count() or 4)
+
+
+def _reset_db_pool():
+    # SQLite 연결은 fork를 넘어 공유하면 안 되므로 자식 프로세스에서 새로 시작
+    global _WRITE_LOCK, _WRITE_CONN, _READ_POOL
+    _WRITE_LOCK = threading.Lock()
+    _WRITE_CONN = None
+    _READ_POOL = LifoQueue(maxsize=os.cpu_count() or 4)
+
+
+if hasattr(os, "register_at_fork"):  # gunicorn --preload 등
+    os.register_at_fork(after_in_child=_reset_db_pool)
+
+
+@contextmanager
+def get_write_db():
+    global _WRITE_CONN
+    with _WRITE_LOCK:
+        if _WRITE_CONN is None:
+            _WRITE_CONN = connect()
+        try:
+            yield _WRITE_CONN
+        except BaseException:
+            _WRITE_CONN.rollback()
+            raise
+
+
+@contextmanager
+def get_read_db():
+    try:
+        conn = _READ_POOL.get_nowait()
+    except Empty:
+        conn = connect(readonly=True)
+    try:
+        yield conn
+    finally:
+        try:
+            _READ_POOL.put_nowait(conn)
+        except Full:
+            conn.close()
+
+
+def init_db():
+    with get_write_db() as conn:
+        c = conn.cursor()
+        c.execute("""
+            CREATE TABLE IF NOT EXISTS assessments (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                subject    TEXT NOT NULL,
+                title      TEXT NOT NULL,
+                due_date   TEXT,
+                detail     TEXT,
+                created_at TEXT
+            )
+        """)
+        # get_assessments의 ORDER BY due_date를 정렬 없이 인덱스 순서로 읽도록
+        c.execute("""
+            CREATE INDEX IF NOT EXISTS idx_assessments_due
+            ON assessments (due_date)
+        """)
+        # NEIS 응답 캐시 (파싱된 결과를 JSON으로 저장)
+        c.execute("""
+            CREATE TABLE IF NOT EXISTS neis_cache (
+                endpoint   TEXT NOT NULL,
+                key        TEXT NOT NULL,
+                value      TEXT NOT NULL,
+                fetched_at TEXT NOT NULL,
+                PRIMARY KEY (endpoint, key)
+            )
+        """)
+        conn.commit()
 
 
 init_db()
 
 
+# cache_get/cache_put은 블로킹 호출이므로 NEIS_LOOP에서는 직접 부르지 않는다
+# (cache_get은 asyncio.to_thread, cache_put은 _cache_put_later로 스레드에서 실행)
+def cache_get(endpoint, key, max_age=None, ymd=None):
+    """max_age(초)보다 오래된 값은 무시. max_age가 None이면 만료 없음
+
+    ymd가 주어지면, 그 날짜가 지난 뒤에 가져온 값은 더 이상 바뀌지 않으므로
+    max_age와 상관없이 사용한다. DB 오류는 캐시 미스로 취급한다.
+    """
+    try:
+        with get_read_db() as conn:
+            row = conn.execute(SQL_CACHE_GET, (endpoint, key)).fetchone()
+    except sqlite3.Error as e:
+        print("cache read error:", e)
+        return None
+    if row is None:
+        return None
+
+    value, fetched_at = row
+    fetched_at = datetime.fromisoformat(fetched_at)
+    immutable = ymd is not None and f"{fetched_at:%Y%m%d}" > str(ymd)
+    if max_age is not None and not immutable:
+        age = now_kst() - fetched_at
+        if age.total_seconds() > max_age:
+            return None
+    return json.loads(value)
+
+
+def cache_put(endpoint, key, value):
+    """저장 실패(다른 프로세스가 DB를 잠근 경우 등)는 기록만 하고 넘어간다"""
+    try:
+        with get_write_db() as conn:
+            conn.execute(
+                SQL_CACHE_PUT,
+                (endpoint, key, json.dumps(value, ensure_ascii=False), now_kst().isoformat()),
+            )
+            conn.commit()
+    except sqlite3.Error as e:
+        print("cache write error:", e)
+
+
 def add_assessment(subject, title, due_date, detail):
-    conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
-    c.execute(
-        """
-        INSERT INTO assessments (subject, title, due_date, detail, created_at)
-        VALUES (?, ?, ?, ?, ?)
-        """,
-        (subject, title, due_date, detail, now_kst().isoformat()),
-    )
-    conn.commit()
-    conn.close()
+    with get_write_db() as conn:
+        conn.execute(
+            SQL_INSERT_ASSESSMENT,
+            (subject, title, due_date, detail, now_kst().isoformat()),
+        )
+        conn.commit()
 
 
 def get_assessments():
-    conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
-    c.execute(
-        """
-        SELECT id, subject, title, due_date, detail, created_at
-        FROM assessments
-        ORDER BY due_date
-        """
-    )
-    rows = c.fetchall()
-    conn.close()
-    return rows
+    with get_read_db() as conn:
+        return conn.execute(SQL_SELECT_ASSESSMENTS).fetchall()
+
+
+def get_assessments_version():
+    """마지막으로 추가된 수행평가의 (id, created_at). 비어 있으면 (0, None)
+
+    수정/삭제 기능이 없으므로 id가 커지지 않았다면 목록도 그대로다.
+    """
+    with get_read_db() as conn:
+        row = conn.execute(SQL_LAST_ASSESSMENT).fetchone()
+    return row or (0, None)
 
 
 # -------------------------------------------------------------
 # NEIS 비동기 호출 부분 (Neispy 4.x 기준)
 # -------------------------------------------------------------
+# Neispy(aiohttp 세션)는 만들어진 이벤트 루프에 묶이므로
+# 백그라운드 스레드에서 루프 하나를 계속 돌리고, 그 안에서 Neispy 하나를 공유한다.
+def run_async(coro, timeout=10):
+    """요청 스레드에서 코루틴을 NEIS_LOOP에 넘기고 결과를 기다린다"""
+    return asyncio.run_coroutine_threadsafe(coro, NEIS_LOOP).result(timeout=timeout)
+
+
+async def _make_session():
+    # 호스트는 NEIS 하나뿐이고 동시 요청도 몇 개 안 되므로 작은 풀을 오래 유지
+    connector = TCPConnector(limit=10, ttl_dns_cache=300, keepalive_timeout=60)
+    return ClientSession(connector=connector)
+
+
+def _start_neis_loop():
+    global NEIS_LOOP, NEIS
+    NEIS_LOOP = asyncio.new_event_loop()
+    # DB 캐시 호출(to_thread 등)용 스레드 풀. 모듈 맨 위에서 ThreadPoolExecutor를 import해
+    # concurrent.futures의 fork 후처리가 _restart_neis_after_fork보다 먼저 등록되게 한다
+    # (늦게 등록되면 fork 직후 submit이 아직 잠긴 전역 락에서 멈춘다)
+    NEIS_LOOP.set_default_executor(ThreadPoolExecutor(thread_name_prefix="neis-db"))
+    threading.Thread(target=NEIS_LOOP.run_forever, name="neis-loop", daemon=True).start()
+    # aiohttp 세션은 자신을 쓸 루프 안에서 만들어야 한다
+    NEIS = Neispy(KEY=NEIS_API_KEY, session=run_async(_make_session()))
+
+
+_start_neis_loop()
+
+
+@atexit.register
+def _close_neis():
+    if NEIS.session and not NEIS.session.closed:
+        run_async(NEIS.session.close())
+    NEIS_LOOP.call_soon_threadsafe(NEIS_LOOP.stop)
+
+
+# 급식/시간표는 하루에 한 번 정도만 바뀌므로 메모리에 TTL 캐시
+# (캐시는 NEIS_LOOP 스레드에서만 읽고 쓴다)
+CACHE_MAXSIZE = 256
+TTL_CACHED = []  # ttl_cached로 감싼 함수들 (한꺼번에 비울 때 사용)
+
+
+def _ttl_for_ymd(ymd):
+    """오늘 데이터는 10분, 지난 날짜는 24시간, 앞으로의 날짜는 1시간"""
+    ymd = str(ymd)
+    today = get_today().ymd
+    if ymd == today:
+        return 10 * 60
+    if ymd < today:
+        return 24 * 60 * 60
+    return 60 * 60
+
+
+def _cache_put_later(endpoint, key, value):
+    # DB가 잠겨 있어도 응답을 기다리게 하지 않도록 저장은 스레드에 맡기고 기다리지 않는다
+    asyncio.get_running_loop().run_in_executor(None, cache_put, endpoint, key, value)
+
+
+def ttl_cached(ttl_for):
+    """neis 인자를 뺀 나머지 인자를 키로 코루틴 결과를 캐시 (예외는 캐시하지 않음)
+
+    같은 키로 동시에 들어온 요청은 진행 중인 한 번의 호출 결과를 같이 기다린다.
+    """
+    def decorator(func):
+        # inflight의 Task는 만든 루프에 묶이므로 이 데코레이터는 NEIS_LOOP에서만 써야 한다.
+        # 루프를 새로 만들면(fork 등) 반드시 clear()로 비워야 한다.
+        cache = {}
+        inflight = {}
+
+        @functools.wraps(func)
+        async def wrapper(neis, *args):
+            now = monotonic()
+            hit = cache.get(args)
+            if hit is not None and hit[1] > now:
+                return hit[0]
+
+            task = inflight.get(args)
+            if task is None:
+                task = inflight[args] = asyncio.ensure_future(func(neis, *args))
+                task.add_done_callback(lambda _: inflight.pop(args, None))
+            value = await asyncio.shield(task)
+
+            now = monotonic()
+            if len(cache) >= CACHE_MAXSIZE:
+                for k in [k for k, (_, exp) in cache.items() if exp <= now]:
+                    del cache[k]
+                if len(cache) >= CACHE_MAXSIZE:
+                    cache.clear()
+            cache[args] = (value, now + ttl_for(*args))
+            return value
+
+        def clear():
+            cache.clear()
+            inflight.clear()
+
+        wrapper.cache = cache
+        wrapper.clear = clear
+        TTL_CACHED.append(wrapper)
+        return wrapper
+    return decorator
+
+
+# NEIS가 느리거나 죽었을 때 페이지가 붙잡히지 않도록 요청마다 타임아웃,
+# 연속 실패가 쌓이면 잠시 요청 자체를 막는다 (서킷 브레이커, 이것도 루프 스레드 전용)
+NEIS_TIMEOUT = 3.0
+BREAKER_THRESHOLD = 3   # 연속 실패 횟수
+BREAKER_COOLDOWN = 30   # 초
+FAILS = {}
+OPEN_UNTIL = {}
+
+
+class CircuitOpen(Exception):
+    pass
+
+
+async def call_neis(name, coro):
+    if monotonic() < OPEN_UNTIL.get(name, 0):
+        coro.close()
+        raise CircuitOpen(f"{name}: NEIS 요청 일시 중단")
+
+    try:
+        result = await asyncio.wait_for(coro, timeout=NEIS_TIMEOUT)
+    except DataNotFound:
+        FAILS[name] = 0  # 데이터가 없을 뿐 NEIS는 정상
+        raise
+    except Exception:
+        FAILS[name] = FAILS.get(name, 0) + 1
+        if FAILS[name] >= BREAKER_THRESHOLD:
+            OPEN_UNTIL[name] = monotonic() + BREAKER_COOLDOWN
+            FAILS[name] = 0
+        raise
+
+    FAILS[name] = 0
+    return result
+
+
 # 1) 학교 코드 조회 (AE, SE)
-async def _async_get_school_codes():
-    async with Neispy(KEY=NEIS_API_KEY) as neis:
-        scinfo = await neis.schoolInfo(SCHUL_NM=SCHOOL_NAME)
-        # 구조: scinfo.schoolInfo[1].row[0]
-        row = scinfo.schoolInfo[1].row[0]
-        ae = row.ATPT_OFCDC_SC_CODE  # 교육청 코드
-        se = row.SD_SCHUL_CODE       # 학교 코드
-        return ae, se
+async def _async_get_school_codes(neis):
+    scinfo = await neis.schoolInfo(SCHUL_NM=SCHOOL_NAME)
+    # 구조: scinfo.schoolInfo[1].row[0]
+    row = scinfo.schoolInfo[1].row[0]
+    ae = row.ATPT_OFCDC_SC_CODE  # 교육청 코드
+    se = row.SD_SCHUL_CODE       # 학교 코드
+    return ae, se
 
 
-AE, SE = asyncio.run(_async_get_school_codes())
+AE, SE = run_async(_async_get_school_codes(NEIS))
 
 
 # 2) 특정 날짜 급식 (yyyyMMdd 문자열)
-async def _async_meal_for_ymd(ae, se, ymd_str: str):
-    async with Neispy(KEY=NEIS_API_KEY) as neis:
-        scmeal = await neis.mealServiceDietInfo(
+_DDISH_SPLIT = re.compile(r"\s*<br\s*/?>\s*")  # 나누면서 앞뒤 공백까지 제거
+
+
+def _parse_meal(scmeal):
+    # 구조: scmeal.mealServiceDietInfo[1].row
+    rows = scmeal.mealServiceDietInfo[1].row
+    if not rows:
+        return []
+    row = rows[0]
+    raw = row.DDISH_NM  # "밥(1.2.)<br/>국(5.6.)..."
+    return [d for d in _DDISH_SPLIT.split(raw.strip()) if d]
+
+
+@ttl_cached(lambda ae, se, ymd_str: _ttl_for_ymd(ymd_str))
+async def _async_meal_for_ymd(neis, ae, se, ymd_str: str):
+    key = f"{ae}/{se}/{ymd_str}"
+    cached = await asyncio.to_thread(
+        cache_get, "meal", key, _ttl_for_ymd(ymd_str), ymd_str
+    )
+    if cached is not None:
+        return cached
+
+    try:
+        scmeal = await call_neis("meal", neis.mealServiceDietInfo(
             ATPT_OFCDC_SC_CODE=ae,
             SD_SCHUL_CODE=se,
             MLSV_YMD=ymd_str,
-        )
-        # 구조: scmeal.mealServiceDietInfo[1].row
-        rows = scmeal.mealServiceDietInfo[1].row
-        if not rows:
-            return []
-        row = rows[0]
-        raw = row.DDISH_NM  # "밥(1.2.)<br/>국(5.6.)..."
-        return [d.strip() for d in raw.split("<br/>")]
+        ))
+        dishes = _parse_meal(scmeal)
+    except DataNotFound:  # 급식 없는 날도 캐시되도록 빈 리스트로
+        dishes = []
+    _cache_put_later("meal", key, dishes)
+    return dishes
+
+
+async def _async_week_meals(neis, ae, se, ymds):
+    """여러 날짜 급식을 동시에 요청 (실패한 날짜는 예외 객체)"""
+    return await asyncio.gather(
+        *[_async_meal_for_ymd(neis, ae, se, ymd) for ymd in ymds],
+        return_exceptions=True,
+    )
 
 
-def get_today_meal():
-    ymd = now_kst().strftime("%Y%m%d")
+async def get_today_meal_async():
     try:
-        return asyncio.run(_async_meal_for_ymd(AE, SE, ymd))
+        return await _async_meal_for_ymd(NEIS, AE, SE, get_today().ymd)
     except Exception as e:
-        print("meal error:", e)
+        print("meal error:", repr(e))
         return []
 
 
-def get_week_meals():
-    """이번 주(월~금) 급식"""
+async def _build_week_meals(week_days):
+    """(이번 주 급식, 모든 날짜를 성공적으로 가져왔는지)"""
     result = []
-    week_days = get_week_dates()
-    weekday_kor = ["월", "화", "수", "목", "금", "토", "일"]
+    complete = True
+    week = await _async_week_meals(NEIS, AE, SE, [d.ymd for d in week_days])
 
-    for d in week_days:
-        ymd = d.strftime("%Y%m%d")
-        try:
-            dishes = asyncio.run(_async_meal_for_ymd(AE, SE, ymd))
-        except Exception as e:
-            print("week meal error:", d, e)
+    for d, dishes in zip(week_days, week):
+        if isinstance(dishes, BaseException):
+            print("week meal error:", d.iso, repr(dishes))
             dishes = []
+            complete = False
 
         result.append(
             {
-                "date": d.strftime("%Y-%m-%d"),
-                "weekday": weekday_kor[d.weekday()],
+                "date": d.iso,
+                "weekday": d.weekday_kor,
                 "dishes": dishes,
             }
         )
-    return result
+    return result, complete
+
+
+async def get_week_meals_async():
+    """이번 주(월~금) 급식 (미리 계산된 WEEK_CACHE가 있으면 그대로)"""
+    return await _week_cached("meals", _build_week_meals)
 
 
 # 3) 특정 날짜 시간표 (고등학교 hisTimetable)
-async def _async_timetable_for_date(ae, se, year, semester, ymd_int, grade, class_nm):
-    async with Neispy(KEY=NEIS_API_KEY) as neis:
-        sctimetable = await neis.hisTimetable(
+def _parse_timetable(sctimetable):
+    # 구조: sctimetable.hisTimetable[1].row
+    rows = sctimetable.hisTimetable[1].row
+    result = []
+    for r in rows:
+        period = int(r.PERIO)
+        subject = r.ITRT_CNTNT
+        result.append((period, subject))
+    result.sort(key=lambda x: x[0])
+    return result
+
+
+@ttl_cached(lambda ae, se, year, semester, ymd_int, grade, class_nm: _ttl_for_ymd(ymd_int))
+async def _async_timetable_for_date(neis, ae, se, year, semester, ymd_int, grade, class_nm):
+    key = f"{ae}/{se}/{year}/{semester}/{grade}/{class_nm}/{ymd_int}"
+    cached = await asyncio.to_thread(
+        cache_get, "timetable", key, _ttl_for_ymd(ymd_int), ymd_int
+    )
+    if cached is not None:
+        return [tuple(r) for r in cached]  # JSON에서는 리스트로 돌아옴
+
+    try:
+        sctimetable = await call_neis("tt", neis.hisTimetable(
             ATPT_OFCDC_SC_CODE=ae,
             SD_SCHUL_CODE=se,
             AY=str(year),
@@ -160,70 +524,178 @@ async def _async_timetable_for_date(ae, se, year, semester, ymd_int, grade, clas
             ALL_TI_YMD=ymd_int,
             GRADE=str(grade),
             CLASS_NM=str(class_nm),
-        )
-        # 구조: sctimetable.hisTimetable[1].row
-        rows = sctimetable.hisTimetable[1].row
-        result = []
-        for r in rows:
-            period = int(r.PERIO)
-            subject = r.ITRT_CNTNT
-            result.append((period, subject))
-        result.sort(key=lambda x: x[0])
-        return result
-
-
-def get_today_timetable():
-    today = now_kst()
-    ymd_int = int(today.strftime("%Y%m%d"))
-    year = today.year
-    try:
-        return asyncio.run(
+        ))
+        rows = _parse_timetable(sctimetable)
+    except DataNotFound:  # 수업 없는 날도 캐시되도록 빈 리스트로
+        rows = []
+    _cache_put_later("timetable", key, rows)
+    return rows
+
+
+async def _async_week_timetable(neis, ae, se, semester, dates, grade, class_nm):
+    """여러 날짜 시간표를 동시에 요청 (실패한 날짜는 예외 객체)"""
+    return await asyncio.gather(
+        *[
             _async_timetable_for_date(
-                AE, SE, year, SEMESTER, ymd_int, GRADE, CLASS_NM
+                neis, ae, se, d.date.year, semester, int(d.ymd),
+                grade, class_nm,
             )
+            for d in dates
+        ],
+        return_exceptions=True,
+    )
+
+
+async def get_today_timetable_async():
+    today = get_today()
+    try:
+        return await _async_timetable_for_date(
+            NEIS, AE, SE, today.date.year, SEMESTER, int(today.ymd), GRADE, CLASS_NM
         )
     except Exception as e:
-        print("timetable error:", e)
+        print("timetable error:", repr(e))
         return []
 
 
-def get_week_timetable():
-    """이번 주(월~금) 날짜별 시간표"""
+async def _build_week_timetable(week_days):
+    """(이번 주 날짜별 시간표, 모든 날짜를 성공적으로 가져왔는지)"""
     result = []
-    week_days = get_week_dates()
-    weekday_kor = ["월", "화", "수", "목", "금", "토", "일"]
+    complete = True
+    week = await _async_week_timetable(
+        NEIS, AE, SE, SEMESTER, week_days, GRADE, CLASS_NM
+    )
 
-    for d in week_days:
-        ymd_int = int(d.strftime("%Y%m%d"))
-        year = d.year
-        try:
-            rows = asyncio.run(
-                _async_timetable_for_date(
-                    AE, SE, year, SEMESTER, ymd_int, GRADE, CLASS_NM
-                )
-            )
-        except Exception as e:
-            print("week timetable error:", d, e)
+    for d, rows in zip(week_days, week):
+        if isinstance(rows, BaseException):
+            print("week timetable error:", d.iso, repr(rows))
             rows = []
+            complete = False
 
         result.append(
             {
-                "date": d.strftime("%Y-%m-%d"),
-                "weekday": weekday_kor[d.weekday()],
+                "date": d.iso,
+                "weekday": d.weekday_kor,
                 "rows": rows,  # [(period, subject), ...]
             }
         )
+    return result, complete
+
+
+async def get_week_timetable_async():
+    """이번 주(월~금) 날짜별 시간표 (미리 계산된 WEEK_CACHE가 있으면 그대로)"""
+    return await _week_cached("tt", _build_week_timetable)
+
+
+# 4) 이번 주 데이터는 하루 한 번 백그라운드에서 미리 계산
+# WEEK_CACHE[name] = (계산한 날의 ymd, 만료 시각, 결과). 루프 스레드에서만 읽고 쓴다.
+# 만료 시각은 그 주 날짜들의 _ttl_for_ymd 중 가장 짧은 값으로 정해서
+# 오늘 칸이나 아직 발표되지 않은 날짜가 하루 종일 고정되지 않게 한다.
+WEEK_CACHE = {}
+REFRESH_AT = time(0, 5)  # 매일 00:05 KST
+
+
+async def _week_cached(name, build, force=False):
+    today = get_today().ymd
+    cached = WEEK_CACHE.get(name)
+    if (
+        not force
+        and cached is not None
+        and cached[0] == today
+        and cached[1] > monotonic()
+    ):
+        return cached[2]
+
+    week_days = get_week_dates()
+    result, complete = await build(week_days)
+    if complete:  # 일부 날짜가 실패했다면 빈 칸으로 두지 않도록 저장하지 않음
+        ttl = min(_ttl_for_ymd(d.ymd) for d in week_days)
+        WEEK_CACHE[name] = (today, monotonic() + ttl, result)
     return result
 
 
+async def refresh_week():
+    await asyncio.gather(
+        _week_cached("meals", _build_week_meals, force=True),
+        _week_cached("tt", _build_week_timetable, force=True),
+    )
+
+
+def _seconds_until_refresh():
+    now = now_kst()
+    target = datetime.combine(now.date(), REFRESH_AT, tzinfo=KST)
+    if target <= now:
+        target += timedelta(days=1)
+    return (target - now).total_seconds()
+
+
+async def daily_refresh():
+    while True:
+        try:
+            await refresh_week()
+        except Exception as e:
+            print("week refresh error:", repr(e))
+        await asyncio.sleep(_seconds_until_refresh())
+
+
+def _start_daily_refresh():
+    global _REFRESH_TASK
+    _REFRESH_TASK = asyncio.run_coroutine_threadsafe(daily_refresh(), NEIS_LOOP)
+
+
+# 5) 대시보드 한 번에 (오늘/이번 주 급식·시간표를 모두 동시에 요청)
+async def _async_dashboard():
+    return await asyncio.gather(
+        get_today_meal_async(),
+        get_today_timetable_async(),
+        get_week_meals_async(),
+        get_week_timetable_async(),
+    )
+
+
+def get_dashboard():
+    """(오늘 급식, 오늘 시간표, 이번 주 급식, 이번 주 시간표)"""
+    try:
+        return run_async(_async_dashboard())
+    except Exception as e:
+        print("dashboard error:", repr(e))
+        return [], [], [], []
+
+
 # -------------------------------------------------------------
 # 날짜/교시 계산
 # -------------------------------------------------------------
-def get_week_dates():
-    """이번 주 월~금 날짜 리스트"""
-    today = now_kst().date()
+WEEKDAY_KOR = ("월", "화", "수", "목", "금", "토", "일")
+
+
+@functools.lru_cache(maxsize=16)
+def _day_info(d):
+    # 날짜 문자열은 여기서 한 번만 만들어 두고 재사용
+    return SimpleNamespace(
+        date=d,
+        ymd=f"{d:%Y%m%d}",
+        iso=f"{d:%Y-%m-%d}",
+        weekday=d.weekday(),
+        weekday_kor=WEEKDAY_KOR[d.weekday()],
+    )
+
+
+def get_today():
+    """오늘(KST)의 date/ymd/iso/weekday/weekday_kor"""
+    return _day_info(now_kst().date())
+
+
+@functools.lru_cache(maxsize=8)
+def _week_dates(today):
     monday = today - timedelta(days=today.weekday())  # 월요일(0)
-    return [monday + timedelta(days=i) for i in range(5)]
+    return tuple(_day_info(monday + timedelta(days=i)) for i in range(5))
+
+
+def get_week_dates():
+    """이번 주 월~금 날짜 리스트 (오늘 날짜 기준으로 캐시)
+
+    각 항목은 date, ymd("20250301"), iso("2025-03-01"), weekday, weekday_kor("월") 속성을 가진다.
+    """
+    return _week_dates(now_kst().date())
 
 
 PERIOD_TIMES = [
@@ -237,13 +709,14 @@ PERIOD_TIMES = [
 ]
 
 
-def get_current_and_next_period():
-    now = now_kst().time()
+def _period_at(now):
+    # 분 단위 표를 만들 때 쓰므로 end는 포함하지 않는다
+    # (end가 9:30이면 9:30:00~9:30:59 전체를 수업 끝난 뒤로 본다)
     current = None
     next_p = None
 
     for idx, (p, start, end) in enumerate(PERIOD_TIMES):
-        if start <= now <= end:
+        if start <= now < end:
             current = p
             if idx + 1 < len(PERIOD_TIMES):
                 next_p = PERIOD_TIMES[idx + 1][0]
@@ -256,32 +729,94 @@ def get_current_and_next_period():
     return None, None
 
 
+# 하루 1440분 각각의 (현재 교시, 다음 교시)를 미리 계산
+PERIOD_BY_MINUTE = tuple(
+    _period_at(time(m // 60, m % 60)) for m in range(24 * 60)
+)
+
+
+def get_current_and_next_period():
+    now = now_kst()
+    return PERIOD_BY_MINUTE[now.hour * 60 + now.minute]
+
+
+# 이번 주 데이터 미리 계산 시작 (날짜 함수들이 정의된 뒤에 시작해야 함)
+_start_daily_refresh()
+
+
+_INHERITED_NEIS = []
+
+
+def _restart_neis_after_fork():
+    # 스레드는 fork 후 자식에 남지 않고, 부모 루프에 묶인 Task/캐시 상태도 쓸 수 없으므로
+    # 모두 비운 뒤 워커마다 루프, 세션, 미리 계산 작업을 새로 시작한다
+    # 부모의 Neispy 세션은 소켓을 부모와 공유하므로 닫지 않고, GC 때
+    # "Unclosed client session" 경고가 나지 않도록 참조만 남겨 둔다
+    _INHERITED_NEIS.append(NEIS)
+    for wrapper in TTL_CACHED:
+        wrapper.clear()
+    WEEK_CACHE.clear()
+    FAILS.clear()
+    OPEN_UNTIL.clear()
+    _start_neis_loop()
+    _start_daily_refresh()
+
+
+if hasattr(os, "register_at_fork"):  # gunicorn --preload 등
+    os.register_at_fork(after_in_child=_restart_neis_after_fork)
+
+
+# -------------------------------------------------------------
+# HTTP 캐시 (ETag / 304)
+# -------------------------------------------------------------
+def make_etag(*parts):
+    return hashlib.blake2b(
+        "|".join(map(str, parts)).encode(), digest_size=8
+    ).hexdigest()
+
+
+def not_modified(etag):
+    """브라우저가 같은 ETag를 갖고 있으면 본문 없이 304 응답"""
+    if request.if_none_match.contains(etag):
+        resp = Response(status=304)
+        resp.set_etag(etag)
+        return resp
+    return None
+
+
 # -------------------------------------------------------------
 # Flask Routes
 # -------------------------------------------------------------
 @app.route("/")
 def index():
-    today = now_kst()
-    weekday_kor = ["월", "화", "수", "목", "금", "토", "일"][today.weekday()]
+    today = get_today()
 
-    meal_list = get_today_meal()
-    timetable = get_today_timetable()
+    meal_list, timetable, week_meals, week_timetable = get_dashboard()
     curr, nextp = get_current_and_next_period()
 
-    week_meals = get_week_meals()
-    week_timetable = get_week_timetable()
+    # 페이지 내용은 날짜, 교시, NEIS 데이터로만 정해지므로 그걸로 ETag를 만든다
+    etag = make_etag(
+        today.ymd, curr, nextp,
+        meal_list, timetable, week_meals, week_timetable,
+    )
+    cached = not_modified(etag)
+    if cached is not None:
+        return cached
 
-    return render_template(
+    resp = app.make_response(render_template(
         "index.html",
-        today_date=today.strftime("%Y-%m-%d"),
-        weekday=weekday_kor,
+        today_date=today.iso,
+        weekday=today.weekday_kor,
         meal_list=meal_list,
         timetable=timetable,
         current_period=curr,
         next_period=nextp,
         week_meals=week_meals,
         week_timetable=week_timetable,
-    )
+    ))
+    resp.set_etag(etag)
+    resp.cache_control.no_cache = True
+    return resp
 
 
 @app.route("/assess", methods=["GET", "POST"])
@@ -301,22 +836,25 @@ def assess():
 
 @app.route("/api/assess")
 def api_assess():
+    last_id, last_created_at = get_assessments_version()
+    etag = make_etag(last_id, last_created_at)
+    cached = not_modified(etag)
+    if cached is not None:
+        return cached
+
     rows = get_assessments()
-    return jsonify(
-        [
-            {
-                "id": r[0],
-                "subject": r[1],
-                "title": r[2],
-                "due_date": r[3],
-                "detail": r[4],
-                "created_at": r[5],
-            }
-            for r in rows
-        ]
-    )
+    resp = jsonify([dict(r) for r in rows])
+    resp.set_etag(etag)
+    if last_created_at:
+        resp.last_modified = datetime.fromisoformat(last_created_at)
+    resp.cache_control.no_cache = True
+    return resp
 
 
 if __name__ == "__main__":
+    # 개발 서버 대신 waitress로 여러 요청을 동시에 처리
+    # (리눅스 배포: gunicorn -w 2 -k gthread --threads 8 app:app)
+    from waitress import serve
+
     port = int(os.environ.get("PORT", 5000))
-    app.run(host="0.0.0.0", port=port)
+    serve(app, host="0.0.0.0", port=port, threads=8)